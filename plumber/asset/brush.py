@@ -1,5 +1,7 @@
+from typing import Dict
+
 import bpy
-from bpy.types import Collection
+from bpy.types import Collection, Material
 
 from .utils import truncate_name
 from ..plumber import BuiltBrushEntity, BuiltSolid, MergedSolids
@@ -10,15 +12,34 @@ def import_brush(brush: BuiltBrushEntity, collection: Collection) -> None:
     class_name = brush.class_name()
     brush_name = f"{class_name}_{id}"
 
+    # the solids of a brush entity (especially worldspawn) share a small set of materials,
+    # so resolve each material datablock only once per entity
+    materials: Dict[str, Material] = {}
+
     merged_solids = brush.merged_solids()
     if merged_solids is not None:
-        import_merged_solids(collection, brush_name, merged_solids)
+        import_merged_solids(collection, brush_name, merged_solids, materials)
 
     for solid in brush.solids():
-        import_solid(collection, brush_name, solid)
+        import_solid(collection, brush_name, solid, materials)
+
+
+def get_material(material: str, materials: Dict[str, Material]) -> Material:
+    material_data = materials.get(material)
+    if material_data is None:
+        material_data = bpy.data.materials.get(truncate_name(material))
+        if material_data is None:
+            material_data = bpy.data.materials.new(material)
+        materials[material] = material_data
+    return material_data
 
 
-def import_solid(collection: Collection, brush_name: str, solid: BuiltSolid) -> None:
+def import_solid(
+    collection: Collection,
+    brush_name: str,
+    solid: BuiltSolid,
+    materials: Dict[str, Material],
+) -> None:
     id = solid.id()
     solid_name = f"{brush_name}_{id}"
     mesh = bpy.data.meshes.new(solid_name)
@@ -46,10 +67,7 @@ def import_solid(collection: Collection, brush_name: str, solid: BuiltSolid) ->
     color_layer.data.foreach_set("color", solid.loop_colors())
 
     for material in solid.materials():
-        material_data = bpy.data.materials.get(truncate_name(material))
-        if material_data is None:
-            material_data = bpy.data.materials.new(material)
-        mesh.materials.append(material_data)
+        mesh.materials.append(get_material(material, materials))
 
     obj = bpy.data.objects.new(solid_name, object_data=mesh)
     obj.location = solid.position()
@@ -58,7 +76,10 @@ def import_solid(collection: Collection, brush_name: str, solid: BuiltSolid) ->
 
 
 def import_merged_solids(
-    collection: Collection, brush_name: str, merged_solids: MergedSolids
+    collection: Collection,
+    brush_name: str,
+    merged_solids: MergedSolids,
+    materials: Dict[str, Material],
 ) -> None:
     mesh = bpy.data.meshes.new(brush_name)
 
@@ -87,10 +108,7 @@ def import_merged_solids(
     color_layer.data.foreach_set("color", merged_solids.loop_colors())
 
     for material in merged_solids.materials():
-        material_data = bpy.data.materials.get(truncate_name(material))
-        if material_data is None:
-            material_data = bpy.data.materials.new(material)
-        mesh.materials.append(material_data)
+        mesh.materials.append(get_material(material, materials))
 
     obj = bpy.data.objects.new(brush_name, object_data=mesh)
     obj.location = merged_solids.position()
@@ -191,8 +191,15 @@ def import_mesh(
         for bone_index, weights in mesh.weight_groups().items():
             bone_name = truncate_name(bones[bone_index].name())
             vg = mesh_obj.vertex_groups.new(name=bone_name)
+
+            # most vertices share a few weights (usually 1.0),
+            # so add them in one call per distinct weight
+            vertices_by_weight: Dict[float, List[int]] = {}
             for vertex_index, weight in weights.items():
-                vg.add([vertex_index], weight, "REPLACE")
+                vertices_by_weight.setdefault(weight, []).append(vertex_index)
+
+            for weight, vertex_indices in vertices_by_weight.items():
+                vg.add(vertex_indices, weight, "REPLACE")
 
     return mesh_obj
 
@@ -1,5 +1,6 @@
 from hashlib import md5
 from base64 import urlsafe_b64encode
+from functools import lru_cache
 from posixpath import split, splitext
 from typing import Optional
 import bpy
@@ -14,6 +15,7 @@ def _hashed(s: str) -> str:
     ].decode("ascii")
 
 
+@lru_cache(maxsize=4096)
 def truncate_name(name: str, maxlen: int = 59) -> str:
     name = name.replace("\\", "/").strip("/")
     if len(name) <= maxlen:
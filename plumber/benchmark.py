@@ -8,7 +8,7 @@ from bpy.props import StringProperty, IntProperty
 from bpy.app.handlers import persistent
 
 from .importer import ImporterOperator, ImporterOperatorProps
-from .preferences import AddonPreferences
+from .preferences import AddonPreferences, get_preferences
 
 from .plumber import log_info
 
@@ -105,18 +105,14 @@ def persistent_benchmarker(_):
 
 
 def register():
-    preferences: AddonPreferences = bpy.context.preferences.addons[
-        __package__
-    ].preferences
+    preferences: AddonPreferences = get_preferences()
 
     if preferences.enable_benchmarking:
         bpy.utils.register_class(BenchmarkVmf)
 
 
 def unregister():
-    preferences: AddonPreferences = bpy.context.preferences.addons[
-        __package__
-    ].preferences
+    preferences: AddonPreferences = get_preferences()
 
     if preferences.enable_benchmarking:
         bpy.utils.unregister_class(BenchmarkVmf)
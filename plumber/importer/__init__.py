@@ -6,9 +6,7 @@ from bpy.props import EnumProperty, BoolProperty, StringProperty
 from bpy.types import Context, Operator, Panel, UILayout
 
 from ..plumber import FileSystem
-from ..preferences import AddonPreferences
-
-from .. import __package__ as ADDON_NAME
+from ..preferences import AddonPreferences, get_preferences
 
 
 class ImporterOperatorProps:
@@ -31,12 +29,12 @@ class ImporterOperator(Operator, ImporterOperatorProps):
         if self.game == "NONE":
             return FileSystem.empty()
         else:
-            preferences = context.preferences.addons[ADDON_NAME].preferences
+            preferences = get_preferences(context)
             game = preferences.games[int(self.game)]
             return game.get_file_system()
 
     def get_threads_suggestion(self, context: Context) -> int:
-        preferences = context.preferences.addons[ADDON_NAME].preferences
+        preferences = get_preferences(context)
         # leave room for blender's thread
         return preferences.threads - 1
 
@@ -267,11 +265,4 @@ CLASSES = [
 ]
 
 
-def register():
-    for cls in CLASSES:
-        bpy.utils.register_class(cls)
-
-
-def unregister():
-    for cls in reversed(CLASSES):
-        bpy.utils.unregister_class(cls)
+register, unregister = bpy.utils.register_classes_factory(CLASSES)
@@ -1,6 +1,6 @@
 from .plumber import discover_filesystems, FileSystem, filesystem_from_gameinfo
 
-from typing import List, Set, Tuple
+from typing import List, Optional, Set, Tuple
 from os.path import isdir
 import os
 
@@ -22,6 +22,12 @@ from bpy.props import (
 import bpy
 
 
+def get_preferences(context: Optional[Context] = None) -> "AddonPreferences":
+    if context is None:
+        context = bpy.context
+    return context.preferences.addons[__package__].preferences
+
+
 class GameSearchPath(PropertyGroup):
     def get_path(self) -> str:
         return self.get("path", "")
@@ -81,12 +87,10 @@ class AddGameSearchPathOperator(Operator):
 
     @classmethod
     def poll(cls, context: Context) -> bool:
-        return bool(context.preferences.addons[__package__].preferences.games)
+        return bool(get_preferences(context).games)
 
     def execute(self, context: Context) -> Set[str]:
-        preferences: AddonPreferences = context.preferences.addons[
-            __package__
-        ].preferences
+        preferences: AddonPreferences = get_preferences(context)
         game: Game = preferences.games[preferences.game_index]
         game.search_paths.add()
         game.search_path_index = len(game.search_paths) - 1
@@ -102,17 +106,13 @@ class RemoveGameSearchPathOperator(Operator):
 
     @classmethod
     def poll(cls, context: Context) -> bool:
-        preferences: AddonPreferences = context.preferences.addons[
-            __package__
-        ].preferences
+        preferences: AddonPreferences = get_preferences(context)
         return bool(preferences.games) and bool(
             preferences.games[preferences.game_index].search_paths
         )
 
     def execute(self, context: Context) -> Set[str]:
-        preferences: AddonPreferences = context.preferences.addons[
-            __package__
-        ].preferences
+        preferences: AddonPreferences = get_preferences(context)
         game: Game = preferences.games[preferences.game_index]
         game.search_paths.remove(game.search_path_index)
         game.search_path_index = min(
@@ -132,17 +132,13 @@ class MoveGameSearchPathOperator(Operator):
 
     @classmethod
     def poll(cls, context: Context) -> bool:
-        preferences: AddonPreferences = context.preferences.addons[
-            __package__
-        ].preferences
+        preferences: AddonPreferences = get_preferences(context)
         return bool(preferences.games) and bool(
             preferences.games[preferences.game_index].search_paths
         )
 
     def execute(self, context: Context) -> Set[str]:
-        preferences: AddonPreferences = context.preferences.addons[
-            __package__
-        ].preferences
+        preferences: AddonPreferences = get_preferences(context)
         game: Game = preferences.games[preferences.game_index]
 
         list_len = len(game.search_paths) - 1
@@ -160,22 +156,26 @@ class Game(PropertyGroup):
         return self.get("name", "")
 
     def set_name(self, value: str) -> None:
-        preferences: "AddonPreferences" = bpy.context.preferences.addons[
-            __package__
-        ].preferences
-        for game in preferences.games:
-            if game == self:
-                continue
-            if game.name == value:
-                number = 1
-                while any(
-                    game.name == f"{value} {number}" for game in preferences.games
-                ):
-                    number += 1
-                value = f"{value} {number}"
-                break
+        if value == self.get("name"):
+            return
+
+        preferences: "AddonPreferences" = get_preferences()
+        existing = {game.name for game in preferences.games if game != self}
+        if value in existing:
+            number = 1
+            while f"{value} {number}" in existing:
+                number += 1
+            value = f"{value} {number}"
         self["name"] = value
 
+    def add_search_paths(self, search_paths: List[Tuple[str, str]]) -> None:
+        for kind, path in search_paths:
+            search_path: GameSearchPath = self.search_paths.add()
+            # detected paths are already absolute and have a known kind,
+            # so skip the path setter which would resolve and stat each path
+            search_path["path"] = path
+            search_path.kind = kind
+
     def get_file_system(self) -> FileSystem:
         return FileSystem(
             self.name, [(path.kind, path.path) for path in self.search_paths]
@@ -220,9 +220,7 @@ class AddGameOperator(Operator):
     bl_options = {"REGISTER"}
 
     def execute(self, context: Context) -> Set[str]:
-        preferences: AddonPreferences = context.preferences.addons[
-            __package__
-        ].preferences
+        preferences: AddonPreferences = get_preferences(context)
         game: Game = preferences.games.add()
         game.name = "New Source Game"
         preferences.game_index = len(preferences.games) - 1
@@ -238,12 +236,10 @@ class RemoveGameOperator(Operator):
 
     @classmethod
     def poll(cls, context: Context) -> bool:
-        return bool(context.preferences.addons[__package__].preferences.games)
+        return bool(get_preferences(context).games)
 
     def execute(self, context: Context) -> Set[str]:
-        preferences: AddonPreferences = context.preferences.addons[
-            __package__
-        ].preferences
+        preferences: AddonPreferences = get_preferences(context)
         preferences.games.remove(preferences.game_index)
         preferences.game_index = min(
             max(0, preferences.game_index - 1), len(preferences.games) - 1
@@ -262,12 +258,10 @@ class MoveGameOperator(Operator):
 
     @classmethod
     def poll(cls, context: Context) -> bool:
-        return bool(context.preferences.addons[__package__].preferences.games)
+        return bool(get_preferences(context).games)
 
     def execute(self, context: Context) -> Set[str]:
-        preferences: AddonPreferences = context.preferences.addons[
-            __package__
-        ].preferences
+        preferences: AddonPreferences = get_preferences(context)
 
         list_len = len(preferences.games) - 1
         index = preferences.game_index
@@ -295,21 +289,20 @@ class DetectGamesOperator(Operator):
 
 
 def detect_games(context: Context):
-    preferences: AddonPreferences = context.preferences.addons[__package__].preferences
+    preferences: AddonPreferences = get_preferences(context)
 
     filesystems = discover_filesystems()
+    existing = {game.name for game in preferences.games}
 
     for filesystem in filesystems:
         name = filesystem.name()
-        if any(name == game.name for game in preferences.games):
+        if name in existing:
             continue
+        existing.add(name)
         search_paths = filesystem.search_paths()
         game: Game = preferences.games.add()
         game.name = name
-        for kind, path in search_paths:
-            search_path: GameSearchPath = game.search_paths.add()
-            search_path.path = path
-            search_path.kind = kind
+        game.add_search_paths(search_paths)
 
 
 class DetectGameinfoOperator(Operator):
@@ -347,7 +340,7 @@ class DetectGameinfoOperator(Operator):
 
 
 def detect_gameinfo(path: str, context: Context):
-    preferences: AddonPreferences = context.preferences.addons[__package__].preferences
+    preferences: AddonPreferences = get_preferences(context)
 
     filesystem = filesystem_from_gameinfo(path)
 
@@ -355,10 +348,31 @@ def detect_gameinfo(path: str, context: Context):
     search_paths = filesystem.search_paths()
     game: Game = preferences.games.add()
     game.name = name
-    for kind, path in search_paths:
-        search_path: GameSearchPath = game.search_paths.add()
-        search_path.path = path
-        search_path.kind = kind
+    game.add_search_paths(search_paths)
+
+
+# the game names the items were last built for, and the built items
+GAME_ENUM_ITEMS_CACHE: Optional[
+    Tuple[Tuple[str, ...], List[Tuple[str, str, str]]]
+] = None
+
+
+def game_enum_items(self: EnumProperty, context: Context) -> List[Tuple[str, str, str]]:
+    global GAME_ENUM_ITEMS_CACHE
+
+    preferences: AddonPreferences = get_preferences(context)
+    names = tuple(game.name for game in preferences.games)
+
+    # Blender requires the returned strings to be kept referenced,
+    # and this is called on every redraw, so reuse the items while the games don't change
+    if GAME_ENUM_ITEMS_CACHE is not None and GAME_ENUM_ITEMS_CACHE[0] == names:
+        return GAME_ENUM_ITEMS_CACHE[1]
+
+    items = [(str(i), name, "") for i, name in enumerate(names)]
+    items.append(("NONE", "None", ""))
+
+    GAME_ENUM_ITEMS_CACHE = (names, items)
+    return items
 
 
 class AddonPreferences(AddonPreferences):
@@ -406,20 +420,7 @@ class AddonPreferences(AddonPreferences):
         update=update_enable_benchmarking,
     )
 
-    @staticmethod
-    def game_enum_items(
-        self: EnumProperty, context: Context
-    ) -> List[Tuple[str, str, str]]:
-        if context is None:
-            context = bpy.context
-        preferences: AddonPreferences = context.preferences.addons[
-            __package__
-        ].preferences
-        items = [
-            (str(i), game.name, "") for i, game in enumerate(preferences.games.values())
-        ]
-        items.append(("NONE", "None", ""))
-        return items
+    game_enum_items = staticmethod(game_enum_items)
 
     def draw(self, context: Context) -> None:
         layout: UILayout = self.layout
@@ -503,14 +504,13 @@ classes = (
     OpenPreferencesOperator,
 )
 
+register_classes, unregister_classes = bpy.utils.register_classes_factory(classes)
+
 
 def register():
-    for cls in classes:
-        bpy.utils.register_class(cls)
+    register_classes()
 
-    preferences: AddonPreferences = bpy.context.preferences.addons[
-        __package__
-    ].preferences
+    preferences: AddonPreferences = get_preferences()
 
     if preferences.threads == 0:
         preferences.threads = max(2, os.cpu_count() or 0)
@@ -520,5 +520,4 @@ def register():
 
 
 def unregister():
-    for cls in reversed(classes):
-        bpy.utils.unregister_class(cls)
+    unregister_classes()
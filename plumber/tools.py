@@ -21,7 +21,7 @@ from plumber.importer import (
 )
 
 from .plumber import FileBrowser
-from .preferences import Game, AddonPreferences
+from .preferences import Game, AddonPreferences, get_preferences
 
 
 class ObjectTransform3DSky(Operator):
@@ -173,26 +173,25 @@ class DirEntryList(UIList):
         flt_flags = []
         flt_neworder = []
 
-        filter_funcs = []
+        filter_supported = self.use_filter_supported
+        filter_name = self.filter_name.lower()
 
-        if self.use_filter_supported:
-            filter_funcs.append(
-                lambda entry: (
-                    entry.kind != "FILE" or get_extension(entry.name) in FILE_IMPORTERS
-                )
-            )
+        if filter_supported or filter_name:
+            # this runs on every redraw of the list, so read each entry's properties only once
+            # and avoid per-entry filter function calls
+            visible = self.bitflag_filter_item
 
-        if self.filter_name:
-            filter = self.filter_name.lower()
-            filter_funcs.append(lambda entry: filter in entry.name.lower())
+            for entry in entries:
+                name = entry.name
 
-        if len(filter_funcs) != 0:
-            flt_flags = [
-                self.bitflag_filter_item
-                if all(filter_func(entry) for filter_func in filter_funcs)
-                else 0
-                for entry in entries
-            ]
+                if (
+                    filter_supported
+                    and entry.kind == "FILE"
+                    and get_extension(name) not in FILE_IMPORTERS
+                ) or (filter_name and filter_name not in name.lower()):
+                    flt_flags.append(0)
+                else:
+                    flt_flags.append(visible)
 
         return flt_flags, flt_neworder
 
@@ -327,9 +326,7 @@ class GameFileBrowser:
     )
 
     def open_game(self, context: Context):
-        preferences: AddonPreferences = context.preferences.addons[
-            __package__
-        ].preferences
+        preferences: AddonPreferences = get_preferences(context)
 
         game: Game = preferences.games[self.game_id]
         type(self).browser = game.get_file_system().browse()
@@ -491,9 +488,7 @@ class IMPORT_MT_plumber_browse(Menu):
     bl_label = "Browse game files"
 
     def draw(self, context: Context):
-        preferences: AddonPreferences = context.preferences.addons[
-            __package__
-        ].preferences
+        preferences: AddonPreferences = get_preferences(context)
 
         for i, game in enumerate(preferences.games):
             self.layout.operator(
@@ -596,10 +591,11 @@ classes = [
     ExtractGameFile,
 ]
 
+register_classes, unregister_classes = bpy.utils.register_classes_factory(classes)
+
 
 def register():
-    for cls in classes:
-        bpy.utils.register_class(cls)
+    register_classes()
 
     bpy.types.VIEW3D_MT_object.append(object_menu_func)
 
@@ -610,18 +606,14 @@ def register():
         type=GameRecentEntriesItem, options=set()
     )
 
-    preferences: AddonPreferences = bpy.context.preferences.addons[
-        __package__
-    ].preferences
+    preferences: AddonPreferences = get_preferences()
 
     if preferences.enable_file_browser_panel:
         bpy.utils.register_class(GameFileBrowserPanel)
 
 
 def unregister():
-    preferences: AddonPreferences = bpy.context.preferences.addons[
-        __package__
-    ].preferences
+    preferences: AddonPreferences = get_preferences()
 
     if preferences.enable_file_browser_panel:
         bpy.utils.unregister_class(GameFileBrowserPanel)
@@ -631,5 +623,4 @@ def unregister():
 
     bpy.types.VIEW3D_MT_object.remove(object_menu_func)
 
-    for cls in reversed(classes):
-        bpy.utils.unregister_class(cls)
+    unregister_classes()
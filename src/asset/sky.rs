@@ -1,9 +1,9 @@
 use std::f32::consts::{FRAC_PI_2, PI};
 use std::io::Cursor;
 
-use float_ord::FloatOrd;
 use image::{ImageBuffer, ImageOutputFormat, Pixel, Rgba32FImage, RgbaImage};
 use pyo3::prelude::*;
+use rayon::prelude::*;
 
 use plumber_core::asset_vmt::skybox::{SkyBox, SkyBoxData};
 
@@ -79,14 +79,24 @@ impl PySkyEqui {
     }
 }
 
-/// Returns a 3D vector pointing to the corresponding pixel location inside a sphere.
-fn spherical_vector(x: u32, y: u32, width: u32, height: u32) -> [f32; 3] {
+/// Returns the sine and cosine of the longitude of the given pixel column.
+fn theta_sin_cos(x: u32, width: u32) -> (f32, f32) {
     let theta = (2.0 * x as f32 / width as f32 - 1.0) * PI;
-    let phi = (2.0 * y as f32 / height as f32 - 1.0) * FRAC_PI_2;
+    theta.sin_cos()
+}
 
-    let (phi_sin, phi_cos) = phi.sin_cos();
-    let (theta_sin, theta_cos) = theta.sin_cos();
+/// Returns the sine and cosine of the latitude of the given pixel row.
+fn phi_sin_cos(y: u32, height: u32) -> (f32, f32) {
+    let phi = (2.0 * y as f32 / height as f32 - 1.0) * FRAC_PI_2;
+    phi.sin_cos()
+}
 
+/// Returns a 3D vector pointing to the corresponding pixel location inside a sphere,
+/// given the sines and cosines of the pixel's longitude and latitude.
+fn spherical_vector(
+    (theta_sin, theta_cos): (f32, f32),
+    (phi_sin, phi_cos): (f32, f32),
+) -> [f32; 3] {
     [phi_cos * theta_cos, phi_sin, phi_cos * theta_sin]
 }
 
@@ -105,12 +115,17 @@ enum SkyboxFace {
 impl SkyboxFace {
     /// Returns the face which the given vector lies on
     fn from_vector(vec: [f32; 3]) -> SkyboxFace {
-        let (largest_magnitude_index, _) = vec
-            .into_iter()
-            .map(f32::abs)
-            .enumerate()
-            .max_by_key(|(_i, magn)| FloatOrd(*magn))
-            .expect("iterator cannot be empty");
+        let [x, y, z] = vec.map(f32::abs);
+
+        // this runs for every output pixel, so pick the axis with plain comparisons,
+        // ties go to the later axis
+        let largest_magnitude_index = if z >= x && z >= y {
+            2
+        } else if y >= x {
+            1
+        } else {
+            0
+        };
 
         let positive = vec[largest_magnitude_index] > 0.0;
 
@@ -138,7 +153,10 @@ impl SkyboxFace {
             SkyboxFace::Back => (x, y, z),
         };
 
-        [(xc / ma.abs() + 1.0) / 2.0, (yc / ma.abs() + 1.0) / 2.0]
+        // (c / |ma| + 1) / 2, with the division done once for both coordinates
+        let scale = 0.5 / ma.abs();
+
+        [xc * scale + 0.5, yc * scale + 0.5]
     }
 }
 
@@ -148,15 +166,14 @@ fn pixel_coordinates(raw_coords: [f32; 2], cubemap_dim: u32) -> [f32; 2] {
     raw_coords.map(|c| c.clamp(0.0, 1.0) * (cubemap_dim - 1) as f32)
 }
 
-/// Converts equirectangular image coordinates into a skybox face and coordinates.
+/// Converts equirectangular image coordinates, given as the sines and cosines
+/// of their longitude and latitude, into a skybox face and coordinates.
 fn equi_coords_to_skybox(
-    x: u32,
-    y: u32,
-    out_width: u32,
-    out_height: u32,
+    theta: (f32, f32),
+    phi: (f32, f32),
     cubemap_dim: u32,
 ) -> (SkyboxFace, [f32; 2]) {
-    let vec = spherical_vector(x, y, out_width, out_height);
+    let vec = spherical_vector(theta, phi);
     let face = SkyboxFace::from_vector(vec);
     let raw_coords = face.raw_coordinates(vec);
     let pixel_coords = pixel_coordinates(raw_coords, cubemap_dim);
@@ -196,12 +213,13 @@ impl SubPixelLerp for u8 {
     }
 }
 
-fn to_equi_inner<P: Pixel>(
+#[allow(clippy::cast_possible_truncation)]
+fn to_equi_inner<P: Pixel + Sync>(
     images: &[ImageBuffer<P, Vec<P::Subpixel>>; 6],
     out_height: Option<u32>,
 ) -> ImageBuffer<P, Vec<P::Subpixel>>
 where
-    P::Subpixel: SubPixelLerp,
+    P::Subpixel: SubPixelLerp + Send + Sync,
 {
     let cubemap_dim = images
         .iter()
@@ -212,12 +230,30 @@ where
     let out_height = out_height.unwrap_or(cubemap_dim * 2);
     let out_width = out_height * 2;
 
-    ImageBuffer::from_fn(out_width, out_height, |x, y| {
-        let (face, [x, y]) = equi_coords_to_skybox(x, y, out_width, out_height, cubemap_dim);
+    let channels = usize::from(P::CHANNEL_COUNT);
+    let row_len = out_width as usize * channels;
+
+    // longitude only depends on the column and latitude only on the row,
+    // so compute the trigonometry once per column and once per row instead of per pixel
+    let thetas: Vec<_> = (0..out_width).map(|x| theta_sin_cos(x, out_width)).collect();
 
-        let image = &images[face as usize];
-        bilinear_interpolate(image, x, y)
-    })
+    let mut out: ImageBuffer<P, Vec<P::Subpixel>> = ImageBuffer::new(out_width, out_height);
+
+    // rows are independent, so convert them in parallel on the current thread pool
+    out.par_chunks_mut(row_len)
+        .enumerate()
+        .for_each(|(y, row)| {
+            let phi = phi_sin_cos(y as u32, out_height);
+
+            for (&theta, pixel) in thetas.iter().zip(row.chunks_exact_mut(channels)) {
+                let (face, [x, y]) = equi_coords_to_skybox(theta, phi, cubemap_dim);
+
+                let image = &images[face as usize];
+                pixel.copy_from_slice(bilinear_interpolate(image, x, y).channels());
+            }
+        });
+
+    out
 }
 
 #[allow(clippy::cast_possible_truncation, clippy::cast_sign_loss)]
@@ -240,12 +276,34 @@ where
     let x_factor = x.fract();
     let y_factor = y.fract();
 
-    let a = lerp_pixel(image.get_pixel(x0, y0), image.get_pixel(x1, y0), x_factor);
-    let b = lerp_pixel(image.get_pixel(x0, y1), image.get_pixel(x1, y1), x_factor);
+    // index the samples directly in the raw buffer, computing both row offsets once
+    let raw: &[P::Subpixel] = image;
+    let channels = usize::from(P::CHANNEL_COUNT);
+
+    let row0 = y0 as usize * width as usize;
+    let row1 = y1 as usize * width as usize;
+    let (x0, x1) = (x0 as usize, x1 as usize);
+
+    let a = lerp_pixel(
+        pixel_at(raw, row0 + x0, channels),
+        pixel_at(raw, row0 + x1, channels),
+        x_factor,
+    );
+    let b = lerp_pixel(
+        pixel_at(raw, row1 + x0, channels),
+        pixel_at(raw, row1 + x1, channels),
+        x_factor,
+    );
 
     lerp_pixel(&a, &b, y_factor)
 }
 
+/// Returns the pixel at the given linear index of a raw image buffer.
+fn pixel_at<P: Pixel>(raw: &[P::Subpixel], index: usize, channels: usize) -> &P {
+    let start = index * channels;
+    P::from_slice(&raw[start..start + channels])
+}
+
 fn lerp_pixel<P: Pixel>(a: &P, b: &P, factor: f32) -> P
 where
     P::Subpixel: SubPixelLerp,
@@ -1,7 +1,7 @@
 use std::{
     cmp::Ordering,
     fs::{self, File},
-    io::{BufRead, BufReader, Write},
+    io::{self, Read, Write},
     path::{Path as StdPath, PathBuf as StdPathBuf},
     time::Instant,
 };
@@ -113,10 +113,18 @@ impl PyFileSystem {
         let start = Instant::now();
         info!("extracting...");
 
+        // one copy buffer is shared by every file of the extraction
+        let mut buffer = vec![0; EXTRACT_BUFFER_SIZE];
+
         if is_dir {
-            extract_directory_recursive(opened.read_dir(&path), target_path)?;
+            extract_directory_recursive(opened.read_dir(&path), target_path, &mut buffer)?;
         } else {
-            extract_file(opened.open_file(&path)?, path.as_str(), target_path)?;
+            extract_file(
+                opened.open_file(&path)?,
+                path.as_str(),
+                target_path,
+                &mut buffer,
+            )?;
         }
 
         info!(
@@ -128,22 +136,27 @@ impl PyFileSystem {
     }
 }
 
-fn extract_file(file: GameFile, file_path: &str, target_path: &StdPath) -> PyResult<()> {
-    let mut target_file = File::create(target_path)?;
+/// Extracted files are copied in 1 MiB chunks, which keeps the amount of
+/// read and write calls low for large models and textures.
+const EXTRACT_BUFFER_SIZE: usize = 1 << 20;
 
-    let mut reader = BufReader::new(file);
+fn extract_file(
+    mut file: GameFile,
+    file_path: &str,
+    target_path: &StdPath,
+    buffer: &mut [u8],
+) -> PyResult<()> {
+    let mut target_file = File::create(target_path)?;
 
     loop {
-        let data = reader.fill_buf()?;
-
-        if data.is_empty() {
-            break;
-        }
-
-        target_file.write_all(data)?;
-        let amt = data.len();
-
-        reader.consume(amt);
+        let read = match file.read(buffer) {
+            Ok(0) => break,
+            Ok(read) => read,
+            Err(err) if err.kind() == io::ErrorKind::Interrupted => continue,
+            Err(err) => return Err(err.into()),
+        };
+
+        target_file.write_all(&buffer[..read])?;
     }
 
     info!(
@@ -155,9 +168,15 @@ fn extract_file(file: GameFile, file_path: &str, target_path: &StdPath) -> PyRes
     Ok(())
 }
 
-fn extract_directory_recursive(read_dir: ReadDir, target_dir: &StdPath) -> PyResult<()> {
-    if !target_dir.is_dir() {
-        fs::create_dir(target_dir)?;
+fn extract_directory_recursive(
+    read_dir: ReadDir,
+    target_dir: &StdPath,
+    buffer: &mut [u8],
+) -> PyResult<()> {
+    // try creating first, so only already existing directories need an extra stat
+    match fs::create_dir(target_dir) {
+        Err(err) if err.kind() == io::ErrorKind::AlreadyExists && target_dir.is_dir() => {}
+        res => res?,
     }
 
     for res in read_dir {
@@ -169,6 +188,7 @@ fn extract_directory_recursive(read_dir: ReadDir, target_dir: &StdPath) -> PyRes
                     entry.open()?,
                     entry.path().as_str(),
                     &target_dir.join(entry.name().as_str()),
+                    buffer,
                 ) {
                     error!(
                         "error extracting file `{}` to `{}`: {}",
@@ -182,6 +202,7 @@ fn extract_directory_recursive(read_dir: ReadDir, target_dir: &StdPath) -> PyRes
                 if let Err(err) = extract_directory_recursive(
                     entry.read_dir(),
                     &target_dir.join(entry.name().as_str()),
+                    buffer,
                 ) {
                     error!(
                         "error extracting directory `{}` to `{}`: {}",